@@ -17,17 +17,25 @@ import contextlib
 from pydub import AudioSegment
 from pydub.silence import split_on_silence
 import numpy as np
-from moviepy.editor import VideoFileClip, AudioFileClip, VideoClip, CompositeVideoClip, TextClip, CompositeAudioClip
-import moviepy.video.fx.all as fx
+from moviepy.editor import VideoFileClip, AudioFileClip, VideoClip, ImageClip, CompositeVideoClip, TextClip, CompositeAudioClip
 from PIL import Image, ImageDraw, ImageFont
 import tempfile
 import json
 import shutil
 import random
+import subprocess
+import importlib.util
+import multiprocessing
+import multiprocessing.connection
+import time
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
 # Import Amazon Polly client
 try:
     import boto3
+    from botocore.config import Config as BotoConfig
     POLLY_AVAILABLE = True
     print(" Amazon Polly client (boto3) available.")
 except ImportError:
@@ -36,16 +44,74 @@ except ImportError:
     print("Install with: pip install boto3")
 
 
-# Whisper import with fallback
-try:
-    import whisper
-    import torch
+# Whisper backends are only located here, not imported: importing torch alone takes seconds.
+# The packages are imported by the model loaders below, the first time a model is actually needed.
+
+# faster-whisper (CTranslate2) is preferred when installed: same models, much faster inference
+FASTER_WHISPER_AVAILABLE = importlib.util.find_spec('faster_whisper') is not None
+if FASTER_WHISPER_AVAILABLE:
+    print(" faster-whisper available for fast, maximum accuracy timing")
+
+# Whisper availability check with fallback
+if importlib.util.find_spec('whisper') is not None and importlib.util.find_spec('torch') is not None:
     WHISPER_AVAILABLE = True
     print(" Whisper AI available for maximum accuracy")
-except ImportError:
+else:
     WHISPER_AVAILABLE = False
-    print("  Whisper AI not available, using fallback methods")
-    print("For best accuracy, install with: pip install pip install openai-whisper torch")
+    # faster-whisper is used instead when installed, so only report a missing backend when neither is there
+    if not FASTER_WHISPER_AVAILABLE:
+        print("  Whisper AI not available, using fallback methods")
+        print("For best accuracy, install with: pip install pip install openai-whisper torch")
+
+# Punctuation ignored when matching Whisper words to the story text, removed in one str.translate pass
+_PUNCT_TABLE = str.maketrans('', '', '.,!?\'"')
+
+# Shared read-only empty frames, keyed by (shape, dtype). Idle subtitle frames return these directly.
+_BLANK_FRAME_CACHE = {}
+
+def _blank_frame(shape, dtype):
+    """Return a cached, read-only all-zero frame of the given shape and dtype."""
+    key = (shape, np.dtype(dtype).str)
+    frame = _BLANK_FRAME_CACHE.get(key)
+    if frame is None:
+        frame = np.zeros(shape, dtype=dtype)
+        frame.setflags(write=False) # Shared across clips, so it must never be drawn into
+        _BLANK_FRAME_CACHE[key] = frame
+    return frame
+
+def _user_cache_dir():
+    """Per-user folder for the persistent Polly cache: %LOCALAPPDATA% on Windows, $XDG_CACHE_HOME or ~/.cache elsewhere."""
+    if sys.platform == 'win32':
+        base_dir = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base_dir, 'reddit_tts', 'polly_cache')
+
+# Heavy clients and models are created once per process and shared by every RedditTTSSubtitles
+# instance, so rendering several stories in one process pays their setup cost once.
+# lru_cache does not cache exceptions, so a failed load is retried by the next instance.
+@functools.lru_cache(maxsize=None)
+def _get_polly_client(max_pool_connections=10):
+    """
+    Return the shared boto3 Polly client (boto3 clients are thread-safe).
+    The HTTP connection pool is sized to the number of concurrent requests, so requests never wait for a connection.
+    """
+    return boto3.client('polly', config=BotoConfig(max_pool_connections=max_pool_connections))
+
+@functools.lru_cache(maxsize=None)
+def _get_faster_whisper_model(model_size='base'):
+    """Return a shared faster-whisper model: float16 on GPU, int8 quantization on CPU."""
+    from faster_whisper import WhisperModel
+    import ctranslate2
+    if ctranslate2.get_cuda_device_count() > 0:
+        return WhisperModel(model_size, device="cuda", compute_type="float16")
+    return WhisperModel(model_size, device="cpu", compute_type="int8")
+
+@functools.lru_cache(maxsize=None)
+def _get_whisper_model(model_size='base'):
+    """Return a shared openai-whisper model (load_model places it on CUDA when available)."""
+    import whisper
+    return whisper.load_model(model_size)
 
 class RedditTTSSubtitles:
     # Define a maximum character limit for Amazon Polly's synthesize_speech operation.
@@ -53,6 +119,44 @@ class RedditTTSSubtitles:
     # value for safety and to allow for chunking at natural breaks.
     POLLY_MAX_CHARS = 2950 # Adjusted for neural voices (max 3000)
 
+    # Upper bound on concurrent synthesize_speech requests for one text
+    POLLY_MAX_WORKERS = 8
+
+    # Polly request pools running at once while preparing a video: main TTS, intro TTS and speech marks
+    POLLY_CONCURRENT_POOLS = 3
+
+    # Reddit formatting patterns stripped by clean_text, compiled once
+    BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+    ITALIC_RE = re.compile(r'\*(.*?)*')
+    STRIKETHROUGH_RE = re.compile(r'~~(.*?)~~')
+    CODE_RE = re.compile(r'`(.*?)`')
+    NEWLINES_RE = re.compile(r'\n+')
+    SPACES_RE = re.compile(r'\s+')
+
+    # Sentence boundaries used to pack text into Polly chunks
+    SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+|\n')
+
+    # How far past the normal 5-word window create_hybrid_timings looks to re-sync after words Whisper
+    # heard that are not in the story text (e.g. a hallucinated phrase)
+    WHISPER_RESYNC_WINDOW = 50
+
+    # Code points counted as syllables by the word duration estimate
+    VOWEL_CODES = np.array([ord(char) for char in 'aeiouAEIOU'], dtype=np.uint32)
+
+    # libx264 encoder threads for the final render (batch workers lower this to share the CPU)
+    ENCODE_THREADS = os.cpu_count() or 1
+
+    # Time ranges of the final video rendered in parallel processes (1 renders in a single process).
+    # Segments are forked, which is only safe on Linux (macOS frameworks can crash in forked children)
+    RENDER_SEGMENTS = min(4, os.cpu_count() or 1) if sys.platform.startswith('linux') else 1
+
+    # Wall-clock seconds allowed per second of video before hung segment processes are stopped (at least 5 minutes)
+    SEGMENT_TIMEOUT_PER_SECOND = 30
+
+    # Outline drawn around the intro card title in the same text call (None disables the outline)
+    CARD_TITLE_OUTLINE_WIDTH = 2
+    CARD_TITLE_OUTLINE_COLOR = (0, 0, 0)
+
     def __init__(self, font_main_path, font_fallback_path, reddit_avatars_folder, obfuscation_file_path):
         self.temp_dir = tempfile.mkdtemp()
         self.whisper_model = None
@@ -61,6 +165,15 @@ class RedditTTSSubtitles:
         self.polly_client = None
         self.polly_available = False
 
+        # Persistent cache of synthesized Polly chunks, shared across runs of the same user.
+        # If it can't be created, the cache only lives in this run's temp folder
+        self.tts_cache_dir = _user_cache_dir()
+        try:
+            os.makedirs(self.tts_cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f" Warning: Could not create TTS cache folder '{self.tts_cache_dir}', caching for this run only: {e}")
+            self.tts_cache_dir = self.temp_dir
+
         # AWS Credentials are now loaded automatically by boto3 from environment variables,
         # AWS shared credentials file (~/.aws/credentials), or IAM roles.
         # DO NOT hardcode them here for GitHub.
@@ -68,7 +181,8 @@ class RedditTTSSubtitles:
             try:
                 # boto3 will automatically pick up credentials from environment variables (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_REGION)
                 # or from ~/.aws/credentials and ~/.aws/config files.
-                self.polly_client = boto3.client('polly') 
+                # One pooled connection per request that can be in flight at once
+                self.polly_client = _get_polly_client(self.POLLY_MAX_WORKERS * self.POLLY_CONCURRENT_POOLS)
                 self.polly_available = True
                 print(" Amazon Polly client initialized. Credentials are loaded from environment/config.")
             except Exception as e:
@@ -81,21 +195,23 @@ class RedditTTSSubtitles:
         # Font paths - now passed as arguments to __init__
         self.font_path_main = font_main_path
         self.font_path_fallback = font_fallback_path
+        # Resolve the font file once; get_best_font only varies the size afterwards
+        self._font_path = self._resolve_font_path()
 
         # Path to Reddit Avatars folder - now passed as argument
         self.reddit_avatars_folder = reddit_avatars_folder
 
-        # Load Whisper model if available
-        if WHISPER_AVAILABLE:
-            try:
-                print("Loading Whisper model (this may take a moment first time)...")
-                # You might consider loading a larger model like "small" or "medium" for better accuracy
-                # self.whisper_model = whisper.load_model("small")
-                self.whisper_model = whisper.load_model("base")
-                print(" Whisper model loaded successfully")
-            except Exception as e:
-                print(f"  Failed to load Whisper model: {e}")
-                self.whisper_model = None
+        # Index the avatar PNGs once instead of re-listing the folder for every intro card
+        try:
+            self._avatar_files = self._list_avatar_files(reddit_avatars_folder)
+        except Exception as e:
+            print(f" Error indexing Reddit avatars folder '{reddit_avatars_folder}': {e}")
+            self._avatar_files = []
+
+        # The Whisper model is loaded on first use by _ensure_whisper_model(). Polly speech marks
+        # usually provide the timings, in which case it is never loaded at all.
+        self.whisper_backend = None
+        self._whisper_load_attempted = False
 
         # Dictionary for common abbreviations to full phrases
         self.abbreviation_map = {
@@ -146,12 +262,20 @@ class RedditTTSSubtitles:
             "SAHD": "Stay at home Dad",
         }
 
+        # Single alternation over all abbreviations, longest first so longer phrases win over their sub-parts.
+        # Word boundaries avoid replacing parts of other words; re.escape handles characters like '.'
+        sorted_keys = sorted(self.abbreviation_map.keys(), key=len, reverse=True)
+        self._abbr_re = re.compile(r'\b(' + '|'.join(re.escape(abbr) for abbr in sorted_keys) + r')\b', re.IGNORECASE)
+        self._abbr_lookup = {abbr.lower(): expansion for abbr, expansion in self.abbreviation_map.items()}
+
         self.obfuscation_map = {}
         # Obfuscation file path is now passed as an argument
         try:
             if obfuscation_file_path and os.path.exists(obfuscation_file_path):
                 with open(obfuscation_file_path, 'r', encoding='utf-8') as f:
-                    self.obfuscation_map = json.load(f)
+                    raw_obfuscation_map = json.load(f)
+                # Lowercase keys once (lookups are case-insensitive) and drop words without alternatives
+                self.obfuscation_map = {word.lower(): tuple(options) for word, options in raw_obfuscation_map.items() if options}
                 print(f" Loaded obfuscation map from: {obfuscation_file_path}")
             else:
                 print(f" Obfuscation file not found at: {obfuscation_file_path if obfuscation_file_path else 'None provided'}. No words will be obfuscated.")
@@ -166,102 +290,130 @@ class RedditTTSSubtitles:
     def clean_text(self, text):
         """Clean and prepare text for TTS, including expanding common abbreviations."""
         # Remove Reddit formatting
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # Bold
-        text = re.sub(r'\*(.*?)*', r'\1', text)      # Italic
-        text = re.sub(r'~~(.*?)~~', r'\1', text)      # Strikethrough
-        text = re.sub(r'`(.*?)`', r'\1', text)        # Code
-        text = re.sub(r'\n+', ' ', text)              # Multiple newlines
-        text = re.sub(r'\s+', ' ', text).strip()      # Multiple spaces
-
-        # Expand common abbreviations (case-insensitive search, replace preserves case if possible)
-        # Iterate over sorted keys to ensure longer phrases are matched before their sub-parts
-        sorted_keys = sorted(self.abbreviation_map.keys(), key=len, reverse=True)
-        for abbr in sorted_keys:
-            # Use regex with word boundaries to avoid replacing parts of other words
-            # re.escape handles special characters in keys like '.'
-            pattern = r'\b' + re.escape(abbr) + r'\b'
-            replacement = self.abbreviation_map[abbr]
-            # Replace case-insensitively using re.IGNORECASE
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        text = self.BOLD_RE.sub(r'\1', text)          # Bold
+        text = self.ITALIC_RE.sub(r'\1', text)        # Italic
+        text = self.STRIKETHROUGH_RE.sub(r'\1', text) # Strikethrough
+        text = self.CODE_RE.sub(r'\1', text)          # Code
+        text = self.NEWLINES_RE.sub(' ', text)        # Multiple newlines
+        text = self.SPACES_RE.sub(' ', text).strip()  # Multiple spaces
+
+        # Expand common abbreviations in a single case-insensitive pass
+        text = self._abbr_re.sub(lambda match: self._abbr_lookup[match.group(1).lower()], text)
 
         return text
 
     def _obfuscate_word(self, word):
         """Obfuscates a word if it's in the obfuscation map."""
-        word_lower = word.lower()
-        if word_lower in self.obfuscation_map:
-            obfuscated_options = self.obfuscation_map[word_lower]
-            if obfuscated_options:
-                return random.choice(obfuscated_options)
-        return word # Return original word if not found or no options
+        if not self.obfuscation_map:
+            return word # Nothing to obfuscate
+        obfuscated_options = self.obfuscation_map.get(word.lower())
+        return random.choice(obfuscated_options) if obfuscated_options else word # Original word if not found
+
+    def _ensure_whisper_model(self):
+        """Load the Whisper model on first use, preferring faster-whisper over openai-whisper (attempted once)"""
+        if self._whisper_load_attempted:
+            return self.whisper_model
+        self._whisper_load_attempted = True
+
+        if FASTER_WHISPER_AVAILABLE:
+            try:
+                print("Loading faster-whisper model (this may take a moment first time)...")
+                self.whisper_model = _get_faster_whisper_model("base")
+                self.whisper_backend = 'faster-whisper'
+                print(" faster-whisper model loaded successfully")
+            except Exception as e:
+                print(f"  Failed to load faster-whisper model: {e}")
+                self.whisper_model = None
+
+        if self.whisper_model is None and WHISPER_AVAILABLE:
+            try:
+                print("Loading Whisper model (this may take a moment first time)...")
+                # You might consider loading a larger model like "small" or "medium" for better accuracy
+                # self.whisper_model = _get_whisper_model("small")
+                self.whisper_model = _get_whisper_model("base")
+                self.whisper_backend = 'openai-whisper'
+                print(" Whisper model loaded successfully")
+            except Exception as e:
+                print(f"  Failed to load Whisper model: {e}")
+                self.whisper_model = None
+
+        return self.whisper_model
 
     def get_whisper_word_timings(self, audio_path, original_text):
         """Use Whisper AI for precise word-level timestamps"""
-        if not self.whisper_model:
+        if not self._ensure_whisper_model():
             return None
 
         print(" Analyzing audio with Whisper AI for precise word timing...")
 
         try:
-            # Transcribe with word-level timestamps
-            result = self.whisper_model.transcribe(
-                audio_path,
-                word_timestamps=True,
-                language='en',
-                verbose=False
-            )
-
-            # Extract word-level timings
-            word_timings = []
-
-            for segment in result['segments']:
-                for word_info in segment.get('words', []):
-                    word_timings.append({
-                        'word': word_info['word'].strip(),
-                        'start': word_info['start'],
-                        'end': word_info['end'],
-                        'duration': word_info['end'] - word_info['start'],
-                        'confidence': word_info.get('probability', 1.0)
-                    })
+            # Transcribe with word-level timestamps as (word, start, end, probability) tuples
+            if self.whisper_backend == 'faster-whisper':
+                segments, _ = self.whisper_model.transcribe(
+                    audio_path,
+                    word_timestamps=True,
+                    language='en'
+                )
+                words = ((word_info.word, word_info.start, word_info.end, word_info.probability)
+                         for segment in segments for word_info in (segment.words or []))
+            else:
+                import torch
+                result = self.whisper_model.transcribe(
+                    audio_path,
+                    word_timestamps=True,
+                    language='en',
+                    fp16=torch.cuda.is_available(), # Half precision only on GPU; CPU would fall back to fp32 anyway
+                    verbose=False
+                )
+                words = ((word_info['word'], word_info['start'], word_info['end'], word_info.get('probability', 1.0))
+                         for segment in result['segments'] for word_info in segment.get('words', []))
 
-            print(f" Whisper found {len(word_timings)} words with precise timestamps")
+            whisper_words = [(word.strip(), start, end, probability) for word, start, end, probability in words]
 
-            # Quality check - if Whisper found too few words, use hybrid approach
-            original_words = original_text.split()
-            # This threshold might need fine-tuning based on your content/model
-            if len(word_timings) < len(original_words) * 0.7:  # Less than 70% match
-                print(" Whisper missed some words, using hybrid approach...")
-                return self.create_hybrid_timings(word_timings, original_words, audio_path)
+            print(f" Whisper found {len(whisper_words)} words with precise timestamps")
 
-            return word_timings
+            # Align Whisper words to the story text in a single pass, estimating any words Whisper missed
+            return self.create_hybrid_timings(whisper_words, original_text.split(), audio_path)
 
         except Exception as e:
             print(f"❌ Whisper analysis failed: {e}")
             return None
 
-    def create_hybrid_timings(self, whisper_timings, original_words, audio_path):
-        """Combine Whisper results with intelligent gap filling"""
+    def create_hybrid_timings(self, whisper_words, original_words, audio_path, total_duration=None):
+        """
+        Combine Whisper results with intelligent gap filling.
+        whisper_words is a list of (word, start, end, probability) tuples in spoken order.
+        total_duration: duration of audio_path if already known, so the file is not reopened.
+        """
         print("🔧 Creating hybrid timing with gap filling...")
 
         # Get total audio duration
-        try:
-            audio_clip = AudioFileClip(audio_path)
-            total_duration = audio_clip.duration
-            audio_clip.close()
-        except:
-            total_duration = len(original_words) * 0.4 # Fallback if audio duration can't be read
+        if total_duration is None:
+            try:
+                audio_clip = AudioFileClip(audio_path)
+                total_duration = audio_clip.duration
+                audio_clip.close()
+            except:
+                total_duration = len(original_words) * 0.4 # Fallback if audio duration can't be read
 
         hybrid_timings = []
         whisper_idx = 0
 
+        # Estimated durations for gap filling, computed for all words in one batch
+        estimated_durations = self._estimate_durations_batch(original_words).tolist()
+
+        # Lowercase and strip punctuation from both word lists once, not on every comparison
+        whisper_clean_words = [word.lower().translate(_PUNCT_TABLE) for word, _, _, _ in whisper_words]
+        original_clean_words = [word.lower().translate(_PUNCT_TABLE) for word in original_words]
+
         for i, original_word in enumerate(original_words):
             # Try to find matching word in Whisper results
             found_match = False
+            original_clean = original_clean_words[i]
 
             # Look for word match in next few Whisper results (sliding window)
-            for j in range(whisper_idx, min(whisper_idx + 5, len(whisper_timings))): # Increased search window
-                whisper_word = whisper_timings[j]['word'].lower().strip('.,!?\'"') # More robust cleaning
-                original_clean = original_word.lower().strip('.,!?\'"')
+            for j in range(whisper_idx, min(whisper_idx + 5, len(whisper_words))): # Increased search window
+                whisper_word = whisper_clean_words[j]
 
                 # Check for exact match or contains match (case-insensitive)
                 if (whisper_word == original_clean or
@@ -269,26 +421,55 @@ class RedditTTSSubtitles:
                     (len(whisper_word) > 2 and whisper_word in original_clean)):
 
                     # Use Whisper timing but with original word (cleaner capitalization, etc.)
-                    timing = whisper_timings[j].copy()
-                    timing['word'] = original_word
-                    hybrid_timings.append(timing)
+                    _, start, end, probability = whisper_words[j]
+                    hybrid_timings.append({
+                        'word': original_word,
+                        'start': start,
+                        'end': end,
+                        'duration': end - start,
+                        'confidence': probability
+                    })
                     whisper_idx = j + 1 # Advance whisper index
                     found_match = True
                     break
 
+            # No match nearby: Whisper may have inserted 5+ words that are not in the text, which the window
+            # alone never gets past. Unless the next words show up in the window (then Whisper just skipped
+            # this word), look further ahead for this word and the two after it, matched exactly so common
+            # words cannot pull the alignment forward, and skip the inserted words
+            if not found_match:
+                window_words = whisper_clean_words[whisper_idx:whisper_idx + 5]
+                if not any(word in window_words for word in original_clean_words[i + 1:i + 4]):
+                    anchor = original_clean_words[i:i + 3]
+                    resync_end = min(whisper_idx + self.WHISPER_RESYNC_WINDOW, len(whisper_words))
+                    for j in range(whisper_idx + 5, resync_end):
+                        if whisper_clean_words[j:j + len(anchor)] != anchor:
+                            continue
+                        _, start, end, probability = whisper_words[j]
+                        hybrid_timings.append({
+                            'word': original_word,
+                            'start': start,
+                            'end': end,
+                            'duration': end - start,
+                            'confidence': probability
+                        })
+                        whisper_idx = j + 1
+                        found_match = True
+                        break
+
             if not found_match:
                 # Estimate timing for missing word
                 if hybrid_timings:
                     last_end = hybrid_timings[-1]['end']
                     # Estimate based on word complexity
-                    word_duration = self.estimate_word_duration(original_word)
+                    word_duration = estimated_durations[i]
                     # Add small pause based on punctuation
                     pause = 0.15 if original_word.endswith(('.', '!', '?')) else 0.05
                     start_time = last_end + pause
                 else:
                     # First word - estimate position (initial small delay)
                     start_time = 0.1
-                    word_duration = self.estimate_word_duration(original_word)
+                    word_duration = estimated_durations[i]
 
                 hybrid_timings.append({
                     'word': original_word,
@@ -306,33 +487,43 @@ class RedditTTSSubtitles:
         return hybrid_timings
 
     def estimate_word_duration(self, word):
-        """Estimate word duration based on complexity"""
-        base_duration = 0.3
+        """Estimate word duration based on complexity (single-word form of _estimate_durations_batch)"""
+        return float(self._estimate_durations_batch([word])[0])
 
-        # Length factor
-        length_factor = len(word) * 0.02 # Slightly reduced impact of length
+    def _estimate_durations_batch(self, words):
+        """Estimate word durations based on complexity for a list of words, returned as a float array"""
+        if not words:
+            return np.zeros(0)
 
-        # Complexity factor (simplified for basic estimation)
-        complexity = 0
-        vowels = 'aeiouAEIOU'
-        syllables = sum(1 for char in word if char in vowels)
-        if syllables > 2:
-            complexity += (syllables - 2) * 0.05
+        # Base duration, plus a length factor, plus a complexity factor for words with more than two vowels
+        lengths = np.fromiter((len(word) for word in words), dtype=np.int64, count=len(words))
 
-        return base_duration + length_factor + complexity
+        # Count vowels for all words at once: one code point per char, then per-word sums via a cumulative count
+        codes = np.frombuffer(''.join(words).encode('utf-32-le'), dtype=np.uint32)
+        vowel_counts = np.concatenate(([0], np.cumsum(np.isin(codes, self.VOWEL_CODES))))
+        word_ends = np.cumsum(lengths)
+        syllables = vowel_counts[word_ends] - vowel_counts[word_ends - lengths]
 
-    def analyze_speech_timing(self, audio_path, text):
-        """Master function - tries Whisper first, falls back to other methods"""
+        return 0.3 + lengths * 0.02 + np.maximum(syllables - 2, 0) * 0.05
+
+    def analyze_speech_timing(self, audio_path, text, audio_duration=None):
+        """
+        Master function - tries Whisper first, falls back to other methods.
+        audio_duration: duration of audio_path if the caller already knows it, so the file is not reopened.
+        """
         print(" Starting speech timing analysis...")
 
         # Try Whisper first (most accurate)
-        if self.whisper_model:
+        if self._ensure_whisper_model():
             whisper_result = self.get_whisper_word_timings(audio_path, text)
             if whisper_result:
                 return whisper_result
 
         # Fallback to estimation
         print(" Falling back to estimation method...")
+        if audio_duration is not None:
+            return self.estimate_word_timings(text, audio_duration)
+
         try:
             # Get audio duration
             audio_clip = AudioFileClip(audio_path)
@@ -349,41 +540,33 @@ class RedditTTSSubtitles:
         words = text.split()
         timings = []
 
-        # Calculate total estimated complexity score (for scaling)
-        total_estimated_duration = sum(self.estimate_word_duration(word) for word in words)
-        
-        current_time = 0.1  # Small initial delay
+        word_durations = self._estimate_durations_batch(words)
 
-        for i, word in enumerate(words):
-            word_duration = self.estimate_word_duration(word)
-            
-            # Scale word duration to fit the overall audio duration, leaving some room for pauses
-            if total_estimated_duration > 0: # Avoid division by zero
-                scaled_duration = (word_duration / total_estimated_duration) * audio_duration * 0.9 # 10% for pauses
-            else:
-                scaled_duration = 0.3 # Default if no words or zero total duration
-
-            # Add natural pauses based on punctuation
-            pause = 0.05
-            if word.endswith((',', ';')):
-                pause = 0.2
-            elif word.endswith(('.', '!', '?')):
-                pause = 0.4
-            
-            # Reduce pause for last word
-            if i == len(words) - 1:
-                pause = 0.1 # Shorter pause at the very end
+        # Scale word durations to fit the overall audio duration, leaving some room for pauses
+        total_estimated_duration = word_durations.sum()
+        if total_estimated_duration > 0: # Avoid division by zero
+            scaled_durations = (word_durations / total_estimated_duration) * audio_duration * 0.9 # 10% for pauses
+        else:
+            scaled_durations = np.full(len(words), 0.3) # Default if no words or zero total duration
 
+        # Add natural pauses based on punctuation
+        pauses = np.array([0.2 if word.endswith((',', ';')) else 0.4 if word.endswith(('.', '!', '?')) else 0.05
+                           for word in words])
+        if words:
+            pauses[-1] = 0.1 # Shorter pause at the very end
+
+        # Each word starts after the previous word and its pause, with a small initial delay
+        start_times = np.cumsum(np.concatenate(([0.1], scaled_durations + pauses)))[:-1]
+
+        for word, start_time, scaled_duration in zip(words, start_times.tolist(), scaled_durations.tolist()):
             timings.append({
                 'word': word,
-                'start': current_time,
-                'end': current_time + scaled_duration,
+                'start': start_time,
+                'end': start_time + scaled_duration,
                 'duration': scaled_duration,
                 'confidence': 0.3  # Low confidence for estimation
             })
 
-            current_time += scaled_duration + pause
-        
         # Adjust final timing to ensure it doesn't exceed audio duration
         if timings and timings[-1]['end'] > audio_duration:
             timings[-1]['end'] = audio_duration
@@ -393,77 +576,144 @@ class RedditTTSSubtitles:
 
     def create_subtitle_clip(self, word_timings, video_size, total_duration):
         """
-        Create animated subtitle overlay clip using a solid magenta background for chroma keying.
+        Create animated subtitle overlay clip with an explicit alpha mask.
         The text will be white with a black outline.
+        Each unique word is rendered once up front; frames only paste the cached glyph.
+        The clip only covers the band the words are drawn in and is positioned accordingly.
         """
         width, height = video_size
 
         # YouTube Shorts style settings
         font_size = min(width // 10, 80)  # Larger font for single word display
+        outline_width = 4 # Increased from 3 to 4 for a slightly more intense outline
 
         # Cache font for better performance
         cached_font = self.get_best_font(font_size)
 
-        def make_frame(t):
-            # Create an RGB image with a solid magenta background.
-            # This magenta will later be made transparent using mask_color.
-            img = Image.new('RGB', (width, height), (255, 0, 255)) # Solid Magenta background
-            draw = ImageDraw.Draw(img)
-
-            font = cached_font
-
-            current_word = None
-            
-            for timing in word_timings:
-                if timing['start'] <= t < timing['end']:
-                    current_word = timing['word']
-                    break
-
-            # If no word is currently being spoken, return a solid magenta frame
-            if not current_word:
-                return np.full((height, width, 3), (255, 0, 255), dtype=np.uint8) # Magenta frame
-
-            # Obfuscate the word before drawing if applicable
-            display_word = self._obfuscate_word(current_word)
-
-            bbox = draw.textbbox((0, 0), display_word, font=font)
+        def render_glyph(display_word):
+            """Render a word once into a small tile; returns (rgb, alpha, x, y) or None if off-screen."""
+            dummy_draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+            bbox = dummy_draw.textbbox((0, 0), display_word, font=cached_font)
             text_width = bbox[2] - bbox[0]
             text_height = bbox[3] - bbox[0]
 
             text_x = (width - text_width) // 2
             text_y = (height - text_height) // 2
 
-            # Draw black outline
-            outline_width = 4 # Increased from 3 to 4 for a slightly more intense outline
-            for adj_x in range(-outline_width, outline_width + 1):
-                for adj_y in range(-outline_width, outline_width + 1):
-                    if adj_x != 0 or adj_y != 0:
-                        draw.text((text_x + adj_x, text_y + adj_y), display_word,
-                                font=font, fill=(0, 0, 0)) # Solid black for outline
-
-            # Draw main text in white
-            draw.text((text_x, text_y), display_word, font=font, fill=(255, 255, 255)) # Solid white for text
-
-            # Return the NumPy array of the RGB image
-            return np.array(img)
-
-        # Create the subtitle clip (RGB content with magenta background)
-        subtitle_clip = VideoClip(make_frame, duration=total_duration)
-
-        # Apply mask_color effect to make the magenta background transparent
-        # This will convert the RGB clip to an RGBA clip with the magenta areas transparent.
-        subtitle_clip = subtitle_clip.fx(fx.mask_color, color=(255, 0, 255), thr=1, s=1)
-        # thr (threshold): 1 means exact match for color.
-        # s (smoothness): 1 means sharp cut-off.
+            # Tile covers the inked area of the word plus the outline margin
+            tile_w = bbox[2] - bbox[0] + 2 * outline_width
+            tile_h = bbox[3] - bbox[1] + 2 * outline_width
+            origin_x = outline_width - bbox[0]
+            origin_y = outline_width - bbox[1]
+
+            tile = Image.new('RGBA', (tile_w, tile_h), (0, 0, 0, 0)) # Fully transparent background
+            draw = ImageDraw.Draw(tile)
+
+            # Draw main text in white with a black outline in a single stroked pass
+            draw.text((origin_x, origin_y), display_word, font=cached_font, fill=(255, 255, 255, 255), # Solid white for text
+                      stroke_width=outline_width, stroke_fill=(0, 0, 0, 255)) # Solid black for outline
+
+            tile_rgba = np.array(tile)
+            tile_rgb = tile_rgba[..., :3]
+            tile_alpha = tile_rgba[..., 3].astype(np.float32) / 255.0
+
+            # Clip the tile to the frame in case the word is wider than the video
+            frame_x = text_x - origin_x
+            frame_y = text_y - origin_y
+            left, top = max(0, -frame_x), max(0, -frame_y)
+            right, bottom = min(tile_w, width - frame_x), min(tile_h, height - frame_y)
+            if right <= left or bottom <= top:
+                return None
+
+            return (tile_rgb[top:bottom, left:right], tile_alpha[top:bottom, left:right],
+                    frame_x + left, frame_y + top)
+
+        # Prerender each unique word (obfuscated once, so the display word stays stable while spoken)
+        glyph_cache = {}
+        for timing in word_timings:
+            if timing['word'] not in glyph_cache:
+                glyph_cache[timing['word']] = render_glyph(self._obfuscate_word(timing['word']))
+
+        # Timings as one structured array filled in a single pass and sorted by start,
+        # so the active word is found with np.searchsorted on a contiguous float field
+        timeline = np.fromiter(((timing['start'], timing['end']) for timing in word_timings),
+                               dtype=[('start', np.float64), ('end', np.float64)], count=len(word_timings))
+        order = np.argsort(timeline['start'], kind='stable')
+        timeline = timeline[order]
+        starts = np.ascontiguousarray(timeline['start'])
+        ends = np.ascontiguousarray(timeline['end'])
+        glyphs = [glyph_cache[word_timings[i]['word']] for i in order]
+
+        # Only the band covered by the glyphs ever changes, so the clip is sized to that band
+        # and positioned over the background; compositing then touches band pixels only
+        rendered = [glyph for glyph in glyph_cache.values() if glyph is not None]
+        if rendered:
+            band_x = min(glyph[2] for glyph in rendered)
+            band_y = min(glyph[3] for glyph in rendered)
+            band_w = max(glyph[2] + glyph[0].shape[1] for glyph in rendered) - band_x
+            band_h = max(glyph[3] + glyph[0].shape[0] for glyph in rendered) - band_y
+        else:
+            band_x, band_y, band_w, band_h = 0, 0, width, height
+
+        # Shared empty color/mask frames, returned as-is when no word is being spoken
+        blank_frame = _blank_frame((band_h, band_w, 3), np.uint8)
+        blank_mask = _blank_frame((band_h, band_w), np.float32)
+
+        def active_index(t):
+            """Return the index of the word spoken at time t, or -1 if no word is active."""
+            idx = int(np.searchsorted(starts, t, side='right')) - 1
+            if idx < 0 or t >= ends[idx]:
+                return -1
+            return idx
+
+        def word_frame_maker(blank, tile_index):
+            """
+            Build a frame function for the color (tile_index 0) or mask (tile_index 1) layer.
+            A frame only changes when the active word changes, so it is composed once per word
+            and the same array is returned for every video frame while that word is spoken.
+            Words are drawn into one reusable canvas; only the previous word's area is cleared.
+            """
+            canvas = blank.copy()
+            state = {'idx': -1, 'frame': blank, 'dirty': None}
+
+            def make(t):
+                idx = active_index(t)
+                if idx != state['idx']:
+                    state['idx'] = idx
+                    glyph = glyphs[idx] if idx >= 0 else None
+                    # If no word is currently being spoken, use the shared empty frame
+                    if glyph is None:
+                        state['frame'] = blank
+                    else:
+                        # Erase the previous word, then draw the new one into the same canvas
+                        if state['dirty'] is not None:
+                            canvas[state['dirty']] = 0
+                        tile, glyph_x, glyph_y = glyph[tile_index], glyph[2] - band_x, glyph[3] - band_y
+                        area = (slice(glyph_y, glyph_y + tile.shape[0]), slice(glyph_x, glyph_x + tile.shape[1]))
+                        canvas[area] = tile
+                        state['dirty'] = area
+                        state['frame'] = canvas
+                return state['frame']
+
+            return make
+
+        make_frame = word_frame_maker(blank_frame, 0)
+        make_mask = word_frame_maker(blank_mask, 1)
+
+        # Create the subtitle clip (RGB content) and attach the alpha mask directly,
+        # so no per-frame chroma keying is needed
+        subtitle_mask = VideoClip(make_mask, ismask=True, duration=total_duration)
+        subtitle_clip = VideoClip(make_frame, duration=total_duration).set_mask(subtitle_mask).set_position((band_x, band_y))
 
         return subtitle_clip
 
 
-    def get_best_font(self, font_size):
+    def _resolve_font_path(self):
         """
-        Get the best available system font, prioritizing user-defined paths.
+        Find the best available system font file, prioritizing user-defined paths.
         It first checks the font paths provided during initialization,
         then common system paths for specific fonts, and finally generic Arial.
+        Returns None if no font could be loaded.
         """
         font_candidates = []
 
@@ -493,19 +743,82 @@ class RedditTTSSubtitles:
         for font_path in font_candidates:
             if os.path.exists(font_path):
                 try:
-                    return ImageFont.truetype(font_path, font_size)
+                    ImageFont.truetype(font_path) # Make sure the file actually loads
+                    return font_path
                 except Exception as e:
                     print(f"Warning: Could not load font '{font_path}': {e}")
                     continue
         
         print("Warning: No suitable system font found. Using default Pillow font (may not display correctly).")
+        return None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _load_font(font_path, font_size):
+        """Load a TrueType font at the given size. Cached per (path, size), so each face is parsed once."""
+        return ImageFont.truetype(font_path, font_size)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _line_height(font):
+        """Height of one line of text ("Tg" bounding box) for a font. Cached per font object."""
+        bbox = font.getbbox("Tg")
+        return bbox[3] - bbox[1]
+
+    def get_best_font(self, font_size):
+        """Get the resolved font at the given size."""
+        if self._font_path:
+            return self._load_font(self._font_path, font_size)
         return ImageFont.load_default()
 
+    @staticmethod
+    def _list_avatar_files(reddit_avatars_folder):
+        """Return the full paths of all PNG avatars in the folder (empty if the folder is missing)."""
+        if not reddit_avatars_folder or not os.path.isdir(reddit_avatars_folder):
+            return []
+        return [os.path.join(reddit_avatars_folder, f) for f in sorted(os.listdir(reddit_avatars_folder))
+                if f.lower().endswith('.png')]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _load_masked_avatar(avatar_path, avatar_size):
+        """Load an avatar, resize it to a square and cut it to a circle. Cached per (path, size)."""
+        avatar_raw = Image.open(avatar_path).convert("RGBA")
+
+        # Resize to square
+        avatar_resized = avatar_raw.resize((avatar_size, avatar_size), Image.Resampling.LANCZOS)
+
+        # Create circular mask
+        mask = Image.new('L', (avatar_size, avatar_size), 0)
+        draw_mask = ImageDraw.Draw(mask)
+        draw_mask.ellipse((0, 0, avatar_size, avatar_size), fill=255)
+
+        # Apply mask to avatar
+        masked_avatar = Image.new('RGBA', (avatar_size, avatar_size), (0, 0, 0, 0))
+        masked_avatar.paste(avatar_resized, (0, 0), mask)
+        return masked_avatar
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _load_rewards_image(rewards_img_path, target_height):
+        """Load the rewards image and scale it to the target height. Cached per (path, height)."""
+        rewards_img_raw = Image.open(rewards_img_path).convert("RGBA") # Ensure it has an alpha channel
+        rewards_img_width = int(rewards_img_raw.width * (target_height / rewards_img_raw.height))
+        return rewards_img_raw.resize((rewards_img_width, target_height), Image.Resampling.LANCZOS)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _card_template(card_width, card_height, radius):
+        """White rounded-rectangle card on a transparent background. Cached; callers draw on a copy."""
+        template = Image.new('RGBA', (card_width, card_height), (0, 0, 0, 0)) # Start with transparent
+        ImageDraw.Draw(template).rounded_rectangle((0, 0, card_width, card_height), radius=radius, fill=(255, 255, 255, 255))
+        return template
+
     def create_intro_title_card(self, video_size, story_title, post_author, rewards_img_path, reddit_avatars_folder, duration=3):
         """
         Creates a static introductory title card clip with story title, rewards.png, and a random Reddit avatar
-        overlaid on a white rectangle. The generated image for the title card will have a transparent
-        background using a magenta chroma key.
+        overlaid on a white rectangle. The clip covers only the card and carries the card's alpha
+        channel as its mask, so everything around the rounded rectangle stays transparent.
         """
         width, height = video_size
         
@@ -526,10 +839,8 @@ class RedditTTSSubtitles:
         
         try:
             if rewards_img_path and os.path.exists(rewards_img_path):
-                rewards_img_raw = Image.open(rewards_img_path).convert("RGBA") # Ensure it has an alpha channel
                 rewards_target_height = int(card_height * 0.08) # Roughly 8% of card height for icon
-                rewards_img_width = int(rewards_img_raw.width * (rewards_target_height / rewards_img_raw.height))
-                rewards_img = rewards_img_raw.resize((rewards_img_width, rewards_target_height), Image.Resampling.LANCZOS)
+                rewards_img = self._load_rewards_image(rewards_img_path, rewards_target_height)
                 rewards_display_height = rewards_img.height
                 print(f" Loaded and resized rewards.png to {rewards_img.width}x{rewards_img.height}")
             else:
@@ -543,24 +854,14 @@ class RedditTTSSubtitles:
         avatar_size = int(card_height * 0.15) # Example size for the avatar
         try:
             if os.path.exists(reddit_avatars_folder) and os.path.isdir(reddit_avatars_folder):
-                avatar_files = [f for f in os.listdir(reddit_avatars_folder) if f.lower().endswith('.png')]
+                if reddit_avatars_folder == self.reddit_avatars_folder:
+                    avatar_files = self._avatar_files
+                else:
+                    avatar_files = self._list_avatar_files(reddit_avatars_folder)
                 if avatar_files:
-                    random_avatar_file = random.choice(avatar_files)
-                    avatar_path = os.path.join(reddit_avatars_folder, random_avatar_file)
-                    avatar_raw = Image.open(avatar_path).convert("RGBA")
-
-                    # Resize to square
-                    avatar_resized = avatar_raw.resize((avatar_size, avatar_size), Image.Resampling.LANCZOS)
-
-                    # Create circular mask
-                    mask = Image.new('L', (avatar_size, avatar_size), 0)
-                    draw_mask = ImageDraw.Draw(mask)
-                    draw_mask.ellipse((0, 0, avatar_size, avatar_size), fill=255)
-                    
-                    # Apply mask to avatar
-                    selected_avatar_img = Image.new('RGBA', (avatar_size, avatar_size), (0, 0, 0, 0))
-                    selected_avatar_img.paste(avatar_resized, (0, 0), mask)
-                    print(f" Loaded and processed random avatar: {random_avatar_file}")
+                    avatar_path = random.choice(avatar_files)
+                    selected_avatar_img = self._load_masked_avatar(avatar_path, avatar_size)
+                    print(f" Loaded and processed random avatar: {os.path.basename(avatar_path)}")
                 else:
                     print(f" No PNG files found in '{reddit_avatars_folder}'. Skipping avatar overlay.")
             else:
@@ -579,7 +880,7 @@ class RedditTTSSubtitles:
         rewards_area_height = rewards_display_height + int(card_height * 0.01) if rewards_img else 0 # Small padding below rewards
 
         # Username line
-        username_line_height = header_font.getbbox("Tg")[3] - header_font.getbbox("Tg")[1] # Height of one line of username text
+        username_line_height = self._line_height(header_font) # Height of one line of username text
         
         # Total header height occupied by avatar, rewards, username, and value
         header_elements_total_height = 0
@@ -601,17 +902,17 @@ class RedditTTSSubtitles:
             text_area_height = int(card_height * 0.1)
 
 
+        # Scratch surface for text measurements, shared by every wrap attempt
+        dummy_draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+
         # Function to wrap text based on estimated width to fit the card
         def wrap_text_for_size(text, font, max_width):
             lines = []
             words = text.split(' ')
             current_line = []
-            
-            dummy_img = Image.new('RGB', (1, 1))
-            dummy_draw = ImageDraw.Draw(dummy_img)
 
             for word in words:
-                test_line = ' '.join(current_line + [word])
+                test_line = f"{' '.join(current_line)} {word}" if current_line else word
                 try:
                     bbox = dummy_draw.textbbox((0, 0), test_line, font=font)
                     test_width = bbox[2] - bbox[0]
@@ -626,37 +927,36 @@ class RedditTTSSubtitles:
             lines.append(' '.join(current_line))
             return lines
 
-        # Iteratively find the largest font size for the main intro text (story_title) that fits
-        optimal_story_title_font_size = min(width // 20, 45) # Start with a reasonable max font size
-        max_attempts = 30 
-        current_attempt = 0
+        def title_fits(size):
+            """Fit test for the binary search: returns (fits, font, wrapped_lines) for a title font size."""
+            font = self.get_best_font(size)
+            wrapped_lines = wrap_text_for_size(story_title, font, card_text_max_width)
+            try:
+                line_height_needed = self._line_height(font) * len(wrapped_lines)
+            except ValueError:
+                line_height_needed = font.getlength("Tg") * len(wrapped_lines)
+            return line_height_needed <= text_area_height, font, wrapped_lines
+
+        # Binary search for the largest font size for the main intro text (story_title) that fits.
+        # A larger font never needs less vertical space, so the fit test is monotonic in font size.
+        min_story_title_font_size = 6
+        max_story_title_font_size = min(width // 20, 45) # Start with a reasonable max font size
 
         best_wrapped_lines = []
         best_story_title_font = None
 
-        while current_attempt < max_attempts and optimal_story_title_font_size > 5:
-            current_font_for_test = self.get_best_font(optimal_story_title_font_size)
-            if not current_font_for_test:
-                break
+        while min_story_title_font_size <= max_story_title_font_size:
+            optimal_story_title_font_size = (min_story_title_font_size + max_story_title_font_size) // 2
+            fits, current_font_for_test, test_wrapped_lines = title_fits(optimal_story_title_font_size)
 
-            test_wrapped_lines = wrap_text_for_size(story_title, current_font_for_test, card_text_max_width)
-            
-            if test_wrapped_lines:
-                try:
-                    line_height_check_bbox = current_font_for_test.getbbox("Tg")
-                    line_height_needed = (line_height_check_bbox[3] - line_height_check_bbox[1]) * len(test_wrapped_lines)
-                except ValueError:
-                    line_height_needed = current_font_for_test.getlength("Tg") * len(test_wrapped_lines)
-            else:
-                line_height_needed = 0
-
-            if line_height_needed <= text_area_height:
+            if fits:
+                # Fits: remember it and try larger sizes
                 best_wrapped_lines = test_wrapped_lines
                 best_story_title_font = current_font_for_test
-                break
-            
-            optimal_story_title_font_size -= 1
-            current_attempt += 1
+                min_story_title_font_size = optimal_story_title_font_size + 1
+            else:
+                # Too tall: try smaller sizes
+                max_story_title_font_size = optimal_story_title_font_size - 1
 
         if not best_story_title_font:
             optimal_story_title_font_size = 10
@@ -664,22 +964,19 @@ class RedditTTSSubtitles:
             best_wrapped_lines = wrap_text_for_size(story_title, best_story_title_font, card_text_max_width)
             print(" Could not find optimal story title font size, using a small default.")
 
+        # Calculate total text block height for centering main text (font-invariant, so measured once here)
+        main_text_line_height = self._line_height(best_story_title_font)
+        main_text_block_height = main_text_line_height * len(best_wrapped_lines)
 
         # Now, make the frame with the determined font and wrapped text
-        def make_card_frame(t):
+        def make_card_frame():
             # Define radius here so it's in scope for this function
             radius = 20 # Adjust radius as needed
 
-            # Create an RGB image with a solid magenta background for chroma keying
-            full_frame_rgb = Image.new('RGB', (width, height), (255, 0, 255)) # Solid Magenta background
-            full_frame_draw = ImageDraw.Draw(full_frame_rgb)
-            
-            # Create the card content on a transparent RGBA image first
-            card_content_img = Image.new('RGBA', (card_width, card_height), (0, 0, 0, 0)) # Start with transparent
+            # Start from a copy of the cached white rounded card on a transparent RGBA image;
+            # its alpha becomes the clip mask
+            card_content_img = self._card_template(card_width, card_height, radius).copy()
             card_content_draw = ImageDraw.Draw(card_content_img)
-            
-            # Draw the white background rectangle with rounded corners onto the transparent image
-            card_content_draw.rounded_rectangle((0, 0, card_width, card_height), radius=radius, fill=(255, 255, 255, 255))
 
             # --- Positioning for elements in the top row ---
             
@@ -709,14 +1006,6 @@ class RedditTTSSubtitles:
 
             card_content_draw.text((post_author_x, post_author_y), post_author, font=header_font, fill=(0, 0, 0))
 
-
-            # Calculate total text block height for centering main text
-            if best_wrapped_lines:
-                main_text_line_height = (best_story_title_font.getbbox("Tg")[3] - best_story_title_font.getbbox("Tg")[1])
-                main_text_block_height = main_text_line_height * len(best_wrapped_lines)
-            else:
-                main_text_block_height = 0
-
             # Calculate the starting Y position for the main text to center it within its allocated area
             # This area starts after the header_elements_total_height and card_vertical_padding
             main_text_area_start_y = header_elements_total_height + card_vertical_padding
@@ -726,116 +1015,303 @@ class RedditTTSSubtitles:
             # Ensure text doesn't start too high (should be below the entire header block)
             current_y_on_card = max(current_y_on_card, header_elements_total_height + int(card_height * 0.02))
 
+            # Outline width for the main text (0 when the outline is disabled)
+            outline_width_card_main_text = self.CARD_TITLE_OUTLINE_WIDTH if self.CARD_TITLE_OUTLINE_COLOR else 0
+
             # Draw each wrapped line of main intro text (story_title)
             for line in best_wrapped_lines:
                 # Text is left-aligned within its text area
                 line_x_on_card = card_horizontal_padding
 
-                # Draw black outline for main text
-                outline_width_card_main_text = 2 
-                for adj_x in range(-outline_width_card_main_text, outline_width_card_main_text + 1):
-                    for adj_y in range(-outline_width_card_main_text, outline_width_card_main_text + 1):
-                        if adj_x != 0 or adj_y != 0:
-                            card_content_draw.text((line_x_on_card + adj_x, current_y_on_card + adj_y), line,
-                                           font=best_story_title_font, fill=(0, 0, 0))
-
-                # Draw main text on card in black
-                card_content_draw.text((line_x_on_card, current_y_on_card), line, font=best_story_title_font, fill=(0, 0, 0))
+                # Draw main text on card in black, with its outline stroked in the same pass
+                card_content_draw.text((line_x_on_card, current_y_on_card), line, font=best_story_title_font, fill=(0, 0, 0),
+                                       stroke_width=outline_width_card_main_text, stroke_fill=self.CARD_TITLE_OUTLINE_COLOR)
                 current_y_on_card += main_text_line_height # Move to next line
 
-            # Position the card content onto the full_frame_rgb
-            card_x_pos = (width - card_width) // 2
-            card_y_pos = (height - card_height) // 2
-            full_frame_rgb.paste(card_content_img, (card_x_pos, card_y_pos), card_content_img) # Use card_content_img as mask
+            return card_content_img
 
-            return np.array(full_frame_rgb)
+        # The card is static, so it is rendered once and shown as a still image.
+        # Its own alpha channel is used as the mask and the clip is only card-sized,
+        # positioned at the center of the frame
+        card_content_img = make_card_frame()
+        card_rgb = np.array(card_content_img.convert('RGB'))
+        card_mask = np.array(card_content_img.getchannel('A')).astype(np.float32) / 255.0
 
-        # The intro clip is created with a magenta background
-        intro_clip = VideoClip(make_card_frame, duration=duration).set_fps(24)
-        # Then, apply mask_color to make the magenta transparent
-        intro_clip = intro_clip.fx(fx.mask_color, color=(255, 0, 255), thr=1, s=1)
+        card_x_pos = (width - card_width) // 2
+        card_y_pos = (height - card_height) // 2
+        intro_mask = ImageClip(card_mask, ismask=True, duration=duration)
+        intro_clip = ImageClip(card_rgb, duration=duration).set_mask(intro_mask).set_fps(24).set_position((card_x_pos, card_y_pos))
 
         return intro_clip
 
-    def _synthesize_and_append(self, text_to_synthesize, voice_id, all_audio_segments_list):
-        """Helper to synthesize a chunk and append to the list."""
+    def _write_cache_file(self, cache_path, data):
+        """
+        Write bytes to a cache file atomically. The data goes to a uniquely named temp file in the
+        cache folder first and is then renamed into place, so threads and batch worker processes
+        never see a partially written file.
+        """
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(cache_path), suffix='.tmp', delete=False) as temp_file:
+            temp_file.write(data)
+        try:
+            os.replace(temp_file.name, cache_path)
+        except OSError:
+            os.remove(temp_file.name) # Don't leave the partial temp file behind
+            raise
+
+    def _synthesize_chunk(self, text_to_synthesize, voice_id):
+        """
+        Helper to synthesize a single chunk and return the path of its mp3 file.
+        Results are cached on disk by (voice, engine, text), so repeated runs skip Polly.
+        """
+        engine = 'neural'
+        cache_key = hashlib.sha256(f"{voice_id}|{engine}|{text_to_synthesize}".encode('utf-8')).hexdigest()
+        cached_audio_file = os.path.join(self.tts_cache_dir, f"{cache_key}.mp3")
+
+        if os.path.exists(cached_audio_file):
+            print(f"Using cached chunk (length {len(text_to_synthesize)}): '{text_to_synthesize[:50]}...'")
+            return cached_audio_file
+
         print(f"Synthesizing chunk (length {len(text_to_synthesize)}): '{text_to_synthesize[:50]}...'")
         try:
             response = self.polly_client.synthesize_speech(
                 VoiceId=voice_id,
                 OutputFormat='mp3',
                 Text=text_to_synthesize,
-                Engine='neural'
+                Engine=engine
             )
-            # Use a temporary file for each chunk with a random component for uniqueness
-            temp_audio_file = os.path.join(self.temp_dir, f"polly_chunk_{len(all_audio_segments_list)}_{random.randint(0,1000)}.mp3")
-            with open(temp_audio_file, 'wb') as file:
-                file.write(response['AudioStream'].read())
-            all_audio_segments_list.append(AudioSegment.from_mp3(temp_audio_file))
+            audio_bytes = response['AudioStream'].read()
         except Exception as e:
             print(f" Error synthesizing chunk: {e}")
             raise # Re-raise to stop processing if a chunk fails
 
+        # A cache that can't be written must not fail a successful request: keep the audio in this run's temp folder
+        try:
+            self._write_cache_file(cached_audio_file, audio_bytes)
+            return cached_audio_file
+        except OSError as e:
+            print(f" Warning: Could not cache chunk audio, keeping it for this run only: {e}")
+            run_audio_file = os.path.join(self.temp_dir, f"{cache_key}.mp3")
+            self._write_cache_file(run_audio_file, audio_bytes)
+            return run_audio_file
+
+    def _synth_chunks_parallel(self, chunks, voice_id):
+        """
+        Synthesize all chunks concurrently and return their mp3 paths in chunk order.
+        Each request is independent and network-bound, and the boto3 client is thread-safe.
+        Repeated chunks are submitted once, since concurrent duplicates would all miss the disk cache.
+        """
+        if not chunks:
+            return []
 
-    def generate_tts_audio(self, text, output_path, voice_gender='J'):
+        unique_chunks = list(dict.fromkeys(chunks))
+        with ThreadPoolExecutor(max_workers=min(self.POLLY_MAX_WORKERS, len(unique_chunks))) as executor:
+            futures = {chunk: executor.submit(self._synthesize_chunk, chunk, voice_id) for chunk in unique_chunks}
+            # Reassemble in chunk order; result() re-raises a failed chunk's exception
+            return [futures[chunk].result() for chunk in chunks]
+
+
+    def _speech_marks_chunk(self, text_to_synthesize, voice_id):
         """
-        Generate TTS audio using Amazon Polly. Handles text chunking for long inputs.
-        Requires AWS credentials to be configured.
-        voice_gender: 'J' for Joanna (female), 'M' for Matthew (male). Defaults to Joanna.
+        Request Polly word speech marks for a chunk and return (word, start_seconds) tuples.
+        Cached on disk next to the chunk audio, so repeated runs skip Polly.
+        """
+        engine = 'neural'
+        cache_key = hashlib.sha256(f"{voice_id}|{engine}|word-marks|{text_to_synthesize}".encode('utf-8')).hexdigest()
+        cached_marks_file = os.path.join(self.tts_cache_dir, f"{cache_key}.json")
+
+        if os.path.exists(cached_marks_file):
+            with open(cached_marks_file, 'r', encoding='utf-8') as file:
+                marks_json = file.read()
+        else:
+            response = self.polly_client.synthesize_speech(
+                VoiceId=voice_id,
+                OutputFormat='json',
+                SpeechMarkTypes=['word'],
+                Text=text_to_synthesize,
+                Engine=engine
+            )
+            marks_bytes = response['AudioStream'].read()
+            try:
+                self._write_cache_file(cached_marks_file, marks_bytes)
+            except OSError as e:
+                print(f" Warning: Could not cache speech marks: {e}") # The marks are still used for this run
+            marks_json = marks_bytes.decode('utf-8')
+
+        # One JSON object per line: {"time": ms, "type": "word", "start": ..., "end": ..., "value": "..."}
+        marks = (json.loads(line) for line in marks_json.splitlines() if line.strip())
+        return [(mark['value'], mark['time'] / 1000.0) for mark in marks if mark.get('type') == 'word']
+
+    def _request_speech_marks(self, text, voice_gender='J'):
+        """Request Polly word speech marks for every chunk of text in parallel; returns one marks list per chunk."""
+        voice_id = 'Matthew' if voice_gender.upper() == 'M' else 'Joanna'
+        chunks = self._split_into_chunks(text)
+        if not chunks:
+            return []
+
+        unique_chunks = list(dict.fromkeys(chunks))
+        with ThreadPoolExecutor(max_workers=min(self.POLLY_MAX_WORKERS, len(unique_chunks))) as executor:
+            futures = {chunk: executor.submit(self._speech_marks_chunk, chunk, voice_id) for chunk in unique_chunks}
+            return [futures[chunk].result() for chunk in chunks]
+
+    def get_polly_word_timings(self, text, original_text, audio_duration, voice_gender='J', speech_marks_future=None):
+        """
+        Word timings from Polly speech marks for the text passed to generate_tts_audio.
+        Polly reports exactly when each word starts, so no speech recognition pass over the audio is needed.
+        The marks are aligned to original_text the same way Whisper words are.
+        speech_marks_future is a Future of _request_speech_marks(text, voice_gender) that was started earlier,
+        e.g. while the audio was synthesized; without one the marks are requested here.
         """
         if not self.polly_available or self.polly_client is None:
-            print(" Amazon Polly client not initialized. Skipping TTS generation.")
-            return False
+            return None
 
-        print(f"Generating TTS audio using Amazon Polly for {len(text)} characters...")
+        print(" Requesting word timings from Amazon Polly speech marks...")
+        voice_id = 'Matthew' if voice_gender.upper() == 'M' else 'Joanna'
 
-        # Determine VoiceId based on gender preference
+        try:
+            chunks = self._split_into_chunks(text)
+            if not chunks:
+                return None
+
+            if speech_marks_future is not None:
+                chunk_marks = speech_marks_future.result()
+            else:
+                chunk_marks = self._request_speech_marks(text, voice_gender)
+
+            # Mark times are relative to their chunk, so offset them by the audio of the preceding chunks
+            marks = []
+            chunk_offset = 0.0
+            for index, (chunk, marks_in_chunk) in enumerate(zip(chunks, chunk_marks)):
+                marks.extend((word, chunk_offset + time) for word, time in marks_in_chunk)
+                if index < len(chunks) - 1:
+                    chunk_clip = AudioFileClip(self._synthesize_chunk(chunk, voice_id)) # Cached from generate_tts_audio
+                    chunk_offset += chunk_clip.duration
+                    chunk_clip.close()
+
+            if not marks:
+                return None
+
+            # A word lasts until the next one starts, but no longer than its estimated duration,
+            # so subtitles clear during pauses
+            words = [word for word, _ in marks]
+            starts = [start for _, start in marks]
+            next_starts = starts[1:] + [audio_duration]
+            max_durations = self._estimate_durations_batch(words).tolist()
+            polly_words = [(word, start, min(next_start, start + max_duration), 1.0)
+                           for word, start, next_start, max_duration in zip(words, starts, next_starts, max_durations)]
+
+            print(f" Polly marked {len(polly_words)} words with exact timestamps")
+
+            return self.create_hybrid_timings(polly_words, original_text.split(), None, total_duration=audio_duration)
+
+        except Exception as e:
+            print(f"❌ Polly speech marks failed: {e}")
+            return None
+
+    def _timings_cache_path(self, text, voice_gender='J'):
+        """Path of the cached word timings for a story text spoken by the given voice."""
         voice_id = 'Matthew' if voice_gender.upper() == 'M' else 'Joanna'
-        print(f"Selected voice: {voice_id}")
+        cache_key = hashlib.sha256(f"{voice_id}|neural|word-timings|{text}".encode('utf-8')).hexdigest()
+        return os.path.join(self.tts_cache_dir, f"{cache_key}.json")
 
-        all_audio_segments = []
+    def _load_cached_timings(self, cache_path):
+        """Return (word_timings, timing_method) saved by an earlier run, or (None, None) if there are none."""
+        if not os.path.exists(cache_path):
+            return None, None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as file:
+                cached = json.load(file)
+            print(f" Using cached word timings ({len(cached['word_timings'])} words)")
+            return cached['word_timings'], cached['timing_method']
+        except (OSError, ValueError, KeyError) as e:
+            print(f" Ignoring unreadable word timings cache {cache_path}: {e}")
+            return None, None
+
+    def _split_into_chunks(self, text):
+        """Pack the text's sentences into chunks of at most POLLY_MAX_CHARS characters, in order."""
+        chunks = []
         
         # Split by sentences. Use a slightly more robust regex if needed for varied punctuation.
-        sentences = re.split(r'(?<=[.!?])\s+|\n', text)
-        sentences = [s.strip() for s in sentences if s.strip()] # Clean up empty strings
+        sentences = (s.strip() for s in self.SENTENCE_SPLIT_RE.split(text))
 
-        current_chunk_text = ""
+        # Sentences of the chunk being packed, joined once when the chunk is queued
+        current_chunk_parts = []
+        current_chunk_length = 0
 
         for sentence in sentences:
+            if not sentence: # Skip empty strings
+                continue
             if len(sentence) > self.POLLY_MAX_CHARS:
                 # If a single sentence is too long, break it into smaller fixed-size pieces
-                if current_chunk_text: # Synthesize any preceding accumulated chunk
-                    self._synthesize_and_append(current_chunk_text, voice_id, all_audio_segments)
-                    current_chunk_text = ""
+                if current_chunk_parts: # Queue any preceding accumulated chunk
+                    chunks.append(" ".join(current_chunk_parts))
+                    current_chunk_parts, current_chunk_length = [], 0
 
                 print(f" Sentence too long ({len(sentence)} chars), splitting into sub-chunks.")
                 # Break long sentence into smaller chunks
                 for i in range(0, len(sentence), self.POLLY_MAX_CHARS):
-                    sub_chunk = sentence[i:i + self.POLLY_MAX_CHARS]
-                    self._synthesize_and_append(sub_chunk, voice_id, all_audio_segments)
+                    chunks.append(sentence[i:i + self.POLLY_MAX_CHARS])
             else:
-                # Add sentence to current chunk if it fits
-                if len(current_chunk_text) + len(sentence) + (1 if current_chunk_text else 0) > self.POLLY_MAX_CHARS:
-                    self._synthesize_and_append(current_chunk_text, voice_id, all_audio_segments)
-                    current_chunk_text = sentence
+                # Add sentence to current chunk if it fits (plus a joining space)
+                added_length = len(sentence) + (1 if current_chunk_parts else 0)
+                if current_chunk_length + added_length > self.POLLY_MAX_CHARS:
+                    chunks.append(" ".join(current_chunk_parts))
+                    current_chunk_parts, current_chunk_length = [sentence], len(sentence)
                 else:
-                    current_chunk_text += (" " if current_chunk_text else "") + sentence
+                    current_chunk_parts.append(sentence)
+                    current_chunk_length += added_length
         
-        # Synthesize any remaining chunk
-        if current_chunk_text:
-            self._synthesize_and_append(current_chunk_text, voice_id, all_audio_segments)
+        # Queue any remaining chunk
+        if current_chunk_parts:
+            chunks.append(" ".join(current_chunk_parts))
+
+        return chunks
 
-        if not all_audio_segments:
+    def generate_tts_audio(self, text, output_path, voice_gender='J'):
+        """
+        Generate TTS audio using Amazon Polly. Handles text chunking for long inputs.
+        Requires AWS credentials to be configured.
+        voice_gender: 'J' for Joanna (female), 'M' for Matthew (male). Defaults to Joanna.
+        """
+        if not self.polly_available or self.polly_client is None:
+            print(" Amazon Polly client not initialized. Skipping TTS generation.")
+            return False
+
+        print(f"Generating TTS audio using Amazon Polly for {len(text)} characters...")
+
+        # Determine VoiceId based on gender preference
+        voice_id = 'Matthew' if voice_gender.upper() == 'M' else 'Joanna'
+        print(f"Selected voice: {voice_id}")
+
+        chunks = self._split_into_chunks(text)
+
+        # Synthesize all chunks in parallel
+        chunk_audio_files = self._synth_chunks_parallel(chunks, voice_id)
+
+        if not chunk_audio_files:
             print("No audio segments were generated.")
             return False
 
-        # Concatenate all audio segments
-        combined_audio = AudioSegment.empty()
-        for audio_segment in all_audio_segments:
-            combined_audio += audio_segment
+        # Concatenate the mp3 chunks with ffmpeg's concat demuxer, stream-copying instead of decoding and re-encoding
+        try:
+            self._concat_mp3_files(chunk_audio_files, output_path)
+            print(f"Amazon Polly TTS audio (combined from chunks) saved to: {output_path}")
+            return True
+        except (subprocess.CalledProcessError, OSError) as e:
+            print(f" ffmpeg concat failed ({e}), falling back to pydub.")
 
-        # Export the combined audio to the final output path
+        # Fallback: decode, concatenate and re-encode all audio segments
         try:
+            audio_segments = [AudioSegment.from_mp3(path) for path in chunk_audio_files]
+            first_segment = audio_segments[0]
+            if all((segment.frame_rate, segment.sample_width, segment.channels) ==
+                   (first_segment.frame_rate, first_segment.sample_width, first_segment.channels) for segment in audio_segments):
+                # Same voice, same format: join the raw samples once instead of copying on every addition
+                combined_audio = AudioSegment(data=b''.join(segment.raw_data for segment in audio_segments),
+                                              sample_width=first_segment.sample_width,
+                                              frame_rate=first_segment.frame_rate,
+                                              channels=first_segment.channels)
+            else:
+                combined_audio = sum(audio_segments, AudioSegment.empty())
             combined_audio.export(output_path, format="mp3")
             print(f"Amazon Polly TTS audio (combined from chunks) saved to: {output_path}")
             return True
@@ -843,17 +1319,165 @@ class RedditTTSSubtitles:
             print(f" Error exporting combined TTS audio: {e}")
             return False
 
-    def create_subtitle_video(self, text, background_video_path, output_path, story_title_arg, post_author_arg, rewards_img_path, reddit_avatars_folder, voice_gender_arg='J'):
-        """Create video with animated subtitles using best available timing method"""
+    def _concat_mp3_files(self, mp3_paths, output_path):
+        """Join mp3 files into output_path without re-encoding. Raises CalledProcessError/OSError on failure."""
+        if len(mp3_paths) == 1:
+            shutil.copyfile(mp3_paths[0], output_path)
+            return
+
+        list_path = self._write_concat_list(mp3_paths, output_path)
+
+        # Use the same ffmpeg binary pydub is configured with
+        subprocess.run([AudioSegment.converter, '-y', '-loglevel', 'error', '-f', 'concat', '-safe', '0',
+                        '-i', list_path, '-c', 'copy', output_path],
+                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    def _write_concat_list(self, paths, output_path):
+        """Write an ffmpeg concat demuxer list of paths for output_path and return the list's path."""
+        list_path = os.path.join(self.temp_dir, f"{os.path.basename(output_path)}.concat.txt")
+        with open(list_path, 'w', encoding='utf-8') as f:
+            for path in paths:
+                escaped_path = os.path.abspath(path).replace("'", "'\\''") # Quote for the concat list syntax
+                f.write(f"file '{escaped_path}'\n")
+        return list_path
+
+    def _write_video_in_segments(self, final_video, background_clip, output_path, fps, segment_count, encode_threads):
+        """
+        Render final_video as segment_count time ranges in parallel forked processes, then join the parts
+        with ffmpeg's concat demuxer and mux in the audio track, without re-encoding either.
+        Frames are produced by Python callbacks, so only separate processes spread them over the cores.
+        Forked children inherit the composed clips, so nothing has to be pickled.
+        Returns False if any step fails, so the caller can fall back to a single render.
+        """
+        try:
+            fork_context = multiprocessing.get_context('fork')
+            # MoviePy renders the frames at np.arange(0, duration, 1 / fps), so this is the frame count of a single pass
+            frame_count = len(np.arange(0, final_video.duration, 1.0 / fps))
+            # Split on frame indices so every part starts exactly on a frame and the parts add up to frame_count.
+            # Each part lasts half a frame less than its frame count, so float rounding in np.arange can
+            # neither add nor drop a frame at a join (which would shift the video against the audio track)
+            first_frames = [round(frame_count * i / segment_count) for i in range(segment_count + 1)]
+            part_frames = [first_frames[i + 1] - first_frames[i] for i in range(segment_count)]
+            part_durations = [(frames - 0.5) / fps for frames in part_frames]
+            if min(part_frames) < 1 or sum(len(np.arange(0, duration, 1.0 / fps)) for duration in part_durations) != frame_count:
+                print(" Segment frame counts do not add up to the video's; rendering in a single pass.")
+                return False
+            part_paths = [os.path.join(self.temp_dir, f"part_{i}.mp4") for i in range(segment_count)]
+            threads_per_segment = max(1, encode_threads // segment_count)
+
+            def render_part(index):
+                # The inherited ffmpeg reader process belongs to the parent; start a fresh one in this child
+                background_clip.reader.proc = None
+                background_clip.reader.initialize()
+                # set_duration rather than a subclip end, since the last part may end just past final_video.duration
+                part = final_video.subclip(first_frames[index] / fps).set_duration(part_durations[index])
+                part.write_videofile(
+                    part_paths[index],
+                    fps=fps,
+                    codec='libx264',
+                    audio=False, # The audio track is muxed in once after concatenation
+                    threads=threads_per_segment,
+                    preset="veryfast",
+                    # Parts are about the same length, so the first part's progress bar stands in for all of them
+                    logger='bar' if index == 0 else None
+                )
+
+            print(f"🎬 Rendering {segment_count} segments in parallel processes...")
+            processes = [fork_context.Process(target=render_part, args=(index,)) for index in range(segment_count)]
+            for process in processes:
+                process.start()
+
+            # Wait for the segments, reporting each one as it finishes. A hung child must not block the run
+            # forever: past the deadline the remaining children are stopped and the caller renders in one pass
+            deadline = time.monotonic() + max(300, self.SEGMENT_TIMEOUT_PER_SECOND * final_video.duration)
+            pending = {process.sentinel: process for process in processes}
+            while pending:
+                remaining = deadline - time.monotonic()
+                finished = multiprocessing.connection.wait(list(pending), timeout=max(0, remaining))
+                if not finished:
+                    print(" Segment rendering timed out; stopping the segment processes.")
+                    for process in pending.values():
+                        process.terminate()
+                    for process in pending.values():
+                        process.join()
+                    return False
+                for sentinel in finished:
+                    pending.pop(sentinel).join()
+                print(f" {segment_count - len(pending)}/{segment_count} segments rendered")
+            if any(process.exitcode != 0 for process in processes):
+                print(" A segment failed to render.")
+                return False
+
+            # Encode the audio track once for the whole video
+            audio_path = os.path.join(self.temp_dir, 'final-audio.m4a')
+            final_video.audio.write_audiofile(audio_path, fps=44100, codec='aac', logger='bar')
+
+            list_path = self._write_concat_list(part_paths, output_path)
+            subprocess.run([AudioSegment.converter, '-y', '-loglevel', 'error', '-f', 'concat', '-safe', '0',
+                            '-i', list_path, '-i', audio_path, '-map', '0:v', '-map', '1:a', '-c', 'copy',
+                            '-movflags', '+faststart', output_path],
+                           check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            return True
+        except Exception as e:
+            print(f" Segmented rendering failed: {e}")
+            return False
+
+    def create_subtitle_video(self, text, background_video_path, output_path, story_title_arg, post_author_arg, rewards_img_path, reddit_avatars_folder, voice_gender_arg='J', max_workers=None):
+        """
+        Create video with animated subtitles using best available timing method.
+        max_workers caps the cores used by the final render (parallel segments and encoder threads);
+        None uses ENCODE_THREADS and RENDER_SEGMENTS.
+        """
         print("🎬 Processing subtitle video with enhanced accuracy...")
 
+        # cleanup() removes the temp folder after every video, so recreate it when the generator is reused
+        os.makedirs(self.temp_dir, exist_ok=True)
+
         # Define a transition buffer duration (e.g., 0.5 seconds)
         transition_buffer_duration = 0.5 # Seconds of blank background between intro and main content
 
-        # Generate TTS audio for main content
+        # Define intro clip duration and text
+        story_title_content = story_title_arg # Already handled by main() parsing story.json
+        post_author_content = post_author_arg # Already handled by main() parsing story.json
+
         main_audio_path = os.path.join(self.temp_dir, "main_tts_audio.mp3")
-        if not self.generate_tts_audio(text, main_audio_path, voice_gender=voice_gender_arg):
+        intro_audio_path = os.path.join(self.temp_dir, "intro_tts_audio.mp3")
+
+        # Define target_video_width and target_video_height at the beginning
+        target_video_width = 1080 # Standard width for vertical video (e.g., YouTube Shorts)
+        target_video_height = 1920 # Standard height for vertical video
+
+        # Main TTS, intro TTS, the main text's speech marks (network-bound), opening the background video
+        # (disk-bound) and rendering the intro card (decoding the avatar and rewards image, loading fonts)
+        # are independent, so they run concurrently; each result is only waited for where it is first needed
+        prep_executor = ThreadPoolExecutor(max_workers=5)
+        main_tts_future = prep_executor.submit(self.generate_tts_audio, text, main_audio_path, voice_gender=voice_gender_arg)
+        # For intro audio, use the story title as the spoken text
+        intro_tts_future = prep_executor.submit(self.generate_tts_audio, story_title_content, intro_audio_path, voice_gender=voice_gender_arg)
+        background_future = prep_executor.submit(VideoFileClip, background_video_path)
+        # The card only depends on the output size and the post; its duration is set once the intro audio is known
+        print(f"Creating intro title card with title: '{story_title_content}' by '{post_author_content}'")
+        intro_card_future = prep_executor.submit(self.create_intro_title_card, (target_video_width, target_video_height),
+                                                 story_title_content, post_author_content, rewards_img_path, reddit_avatars_folder)
+        # Word timings from an earlier run of the same text and voice make the speech marks unnecessary
+        timings_cache_path = self._timings_cache_path(text, voice_gender_arg)
+        # Speech marks only depend on the text, so they are fetched while the audio is synthesized
+        speech_marks_future = None
+        if self.polly_available and self.polly_client is not None and not os.path.exists(timings_cache_path):
+            speech_marks_future = prep_executor.submit(self._request_speech_marks, text, voice_gender_arg)
+        prep_executor.shutdown(wait=False) # Submitted work keeps running; no more is accepted
+
+        def discard_background():
+            """Close the background clip opened ahead of time when exiting before it is used."""
+            try:
+                background_future.result().close()
+            except Exception:
+                pass # Failed to open, nothing to close
+
+        # Generate TTS audio for main content
+        if not main_tts_future.result():
             print("Exiting due to main content TTS audio generation failure.")
+            discard_background()
             return False
 
         # Load main content TTS audio and get duration
@@ -863,16 +1487,11 @@ class RedditTTSSubtitles:
             print(f"Main audio duration: {main_audio_duration:.2f}s")
         except Exception as e:
             print(f"Error loading main TTS audio: {e}")
+            discard_background()
             return False
 
-        # Define intro clip duration and text
-        story_title_content = story_title_arg # Already handled by main() parsing story.json
-        post_author_content = post_author_arg # Already handled by main() parsing story.json
-        
         # Generate TTS audio for intro text
-        intro_audio_path = os.path.join(self.temp_dir, "intro_tts_audio.mp3")
-        # For intro audio, use the story title as the spoken text
-        if not self.generate_tts_audio(story_title_content, intro_audio_path, voice_gender=voice_gender_arg):
+        if not intro_tts_future.result():
             print("Exiting due to intro TTS audio generation failure.")
             intro_audio_duration = 1.0 # Default short silent intro
         else:
@@ -893,12 +1512,8 @@ class RedditTTSSubtitles:
         subtitle_clip = None
         intro_title_card_clip = None # Initialize intro clip
 
-        # Define target_video_width and target_video_height at the beginning
-        target_video_width = 1080 # Standard width for vertical video (e.g., YouTube Shorts)
-        target_video_height = 1920 # Standard height for vertical video
-
         try:
-            background_full = VideoFileClip(background_video_path)
+            background_full = background_future.result() # Opened concurrently with TTS
 
             print(f"Original background video size: {background_full.w}x{background_full.h}")
             print(f"Original background video duration: {background_full.duration:.2f}s")
@@ -927,18 +1542,21 @@ class RedditTTSSubtitles:
             # Choose the larger scale factor to ensure the video covers the target dimensions
             scale_factor = max(scale_w, scale_h)
 
-            # Resize the background video segment to fill the target dimensions, potentially exceeding
-            background_for_composite = background_for_composite.resize(scale_factor)
-            print(f"Background video resized to (after scaling): {background_for_composite.w}x{background_for_composite.h}")
-
-            # Crop the resized video to the exact target dimensions, centering the crop
-            final_background_video_clip = background_for_composite.crop(
+            # Crop the source to the target aspect ratio first (a cheap array slice), centering the crop,
+            # so the resize only resamples pixels that end up in the output
+            source_crop_width = min(background_for_composite.w, round(target_video_width / scale_factor))
+            source_crop_height = min(background_for_composite.h, round(target_video_height / scale_factor))
+            background_for_composite = background_for_composite.crop(
                 x_center=background_for_composite.w / 2,
                 y_center=background_for_composite.h / 2,
-                width=target_video_width,
-                height=target_video_height
+                width=source_crop_width,
+                height=source_crop_height
             )
-            print(f"Background video cropped to final size: {final_background_video_clip.w}x{final_background_video_clip.h}")
+            print(f"Background video cropped to (before scaling): {background_for_composite.w}x{background_for_composite.h}")
+
+            # Resize the cropped segment to exactly the target dimensions
+            final_background_video_clip = background_for_composite.resize((target_video_width, target_video_height))
+            print(f"Background video resized to final size: {final_background_video_clip.w}x{final_background_video_clip.h}")
             print(f"Final background video clip duration: {final_background_video_clip.duration:.2f}s")
 
             video_size = (final_background_video_clip.w, final_background_video_clip.h)
@@ -950,27 +1568,38 @@ class RedditTTSSubtitles:
             traceback.print_exc() # Print full traceback for debugging
             return False
 
-        # The background clip for the intro and buffer duration
-        background_for_intro_clip = final_background_video_clip.subclip(0, intro_audio_duration + transition_buffer_duration)
-
-        # Create the intro title card clip
-        print(f"Creating intro title card for {intro_audio_duration:.2f}s with title: '{story_title_content}' by '{post_author_content}'")
-        # Pass rewards_img_path and reddit_avatars_folder to create_intro_title_card
-        intro_title_card_clip = self.create_intro_title_card(video_size, story_title_content, post_author_content, rewards_img_path, reddit_avatars_folder, duration=intro_audio_duration)
+        # Intro title card clip, rendered while the audio was generated, shown for the intro audio's duration
+        intro_title_card_clip = intro_card_future.result().set_duration(intro_audio_duration)
         intro_title_card_clip = intro_title_card_clip.set_opacity(1.0) # Ensure it's fully opaque
 
 
         # Clean text and get the most accurate word timings possible for main content
         clean_text = self.clean_text(text)
-        word_timings = self.analyze_speech_timing(main_audio_path, clean_text)
+        # Timings cached by an earlier run of this text and voice (the audio is cached too, so they still match it)
+        word_timings, timing_method = self._load_cached_timings(timings_cache_path)
+        used_speech_marks = False
+        if word_timings is None:
+            # Polly speech marks give exact timings without analyzing the audio; Whisper/estimation are the fallback
+            word_timings = self.get_polly_word_timings(text, clean_text, main_audio_duration, voice_gender=voice_gender_arg,
+                                                       speech_marks_future=speech_marks_future)
+            used_speech_marks = bool(word_timings)
+            if not used_speech_marks:
+                word_timings = self.analyze_speech_timing(main_audio_path, clean_text, audio_duration=main_audio_duration)
 
         # Print timing method used
         if word_timings and len(word_timings) > 0:
             avg_confidence = sum(t.get('confidence', 1.0) for t in word_timings) / len(word_timings)
-            if avg_confidence > 0.8:
-                timing_method = "Whisper AI (High Accuracy)"
-            else:
-                timing_method = "Estimation (Basic Accuracy)"
+            if timing_method is None: # Not loaded from the cache
+                if avg_confidence > 0.8:
+                    timing_method = "Polly Speech Marks (Exact)" if used_speech_marks else "Whisper AI (High Accuracy)"
+                    # Only exact timings are cached: estimates are cheap, and a later run may get exact ones
+                    try:
+                        self._write_cache_file(timings_cache_path, json.dumps({'timing_method': timing_method,
+                                                                               'word_timings': word_timings}).encode('utf-8'))
+                    except OSError as e:
+                        print(f" Could not cache word timings: {e}")
+                else:
+                    timing_method = "Estimation (Basic Accuracy)"
 
             print(f" Timing Method: {timing_method}")
             print(f" Average Confidence: {avg_confidence:.2f}")
@@ -981,40 +1610,27 @@ class RedditTTSSubtitles:
         subtitle_clip = self.create_subtitle_clip(word_timings, video_size, main_audio_duration)
         # No set_start here, as it will be set relative to its parent composite later
 
-        # Create a silent audio clip for the transition buffer
-        silent_buffer_audio_segment = AudioSegment.silent(duration=int(transition_buffer_duration * 1000))
-        silent_buffer_audio_path = os.path.join(self.temp_dir, "silent_buffer_audio.mp3")
-        silent_buffer_audio_segment.export(silent_buffer_audio_path, format="mp3")
-        silent_buffer_audio_clip = AudioFileClip(silent_buffer_audio_path)
-
-
-        # Concatenate intro TTS audio, silent buffer audio, and main TTS audio
+        # Place intro TTS audio and main TTS audio on one track.
+        # CompositeAudioClip outputs silence wherever no clip is playing, so the transition buffer
+        # (and the whole intro, if its TTS failed) needs no generated silent audio
         # Define main_content_start_time correctly
         main_content_start_time = intro_audio_duration + transition_buffer_duration 
+        audio_track_clips = [main_tts_audio.set_start(main_content_start_time)] # Main audio starts after buffer
         if 'intro_tts_audio' in locals() and intro_tts_audio is not None:
-             final_audio_track = CompositeAudioClip([
-                intro_tts_audio.set_start(0),
-                silent_buffer_audio_clip.set_start(intro_audio_duration), # Buffer starts after intro audio
-                main_tts_audio.set_start(main_content_start_time) # Main audio starts after buffer
-            ])
-        else: # Fallback to silent intro audio if TTS failed for intro
-            silent_intro_audio_segment = AudioSegment.silent(duration=int(intro_audio_duration * 1000))
-            silent_intro_audio_path = os.path.join(self.temp_dir, "silent_intro_audio_fallback.mp3")
-            silent_intro_audio_segment.export(silent_intro_audio_path, format="mp3")
-            silent_intro_audio_clip = AudioFileClip(silent_intro_audio_path)
-            final_audio_track = CompositeAudioClip([
-                silent_intro_audio_clip.set_start(0),
-                silent_buffer_audio_clip.set_start(intro_audio_duration),
-                main_tts_audio.set_start(main_content_start_time)
-            ])
+            audio_track_clips.insert(0, intro_tts_audio.set_start(0))
+        final_audio_track = CompositeAudioClip(audio_track_clips)
 
 
+        # Background segments for the intro + buffer and for the main content, sliced once each
+        background_for_intro_clip = final_background_video_clip.subclip(0, main_content_start_time)
+        background_for_main_clip = final_background_video_clip.subclip(main_content_start_time, total_final_video_duration)
+
         # Composite everything
         print("🎬 Compositing final video...")
         try:
             # The intro composite (background video for intro duration + title card)
             intro_composite = CompositeVideoClip([
-                final_background_video_clip.subclip(0, intro_audio_duration + transition_buffer_duration), # Background for intro + buffer
+                background_for_intro_clip, # Background for intro + buffer
                 intro_title_card_clip.set_start(0) # Title card at start of this composite
             ], size=video_size).set_duration(intro_audio_duration + transition_buffer_duration) # Total duration for this block
 
@@ -1023,7 +1639,7 @@ class RedditTTSSubtitles:
             # The subtitle clip is placed at 0 relative to the start of this composite,
             # and then this composite is itself positioned at `main_content_start_time`
             main_content_clip = CompositeVideoClip([
-                final_background_video_clip.subclip(main_content_start_time, total_final_video_duration), # Background for main content
+                background_for_main_clip, # Background for main content
                 subtitle_clip.set_start(0) # Subtitles should start at 0 relative to main_content_clip's start
             ], size=video_size).set_duration(main_audio_duration) # This composite's own duration
 
@@ -1036,19 +1652,27 @@ class RedditTTSSubtitles:
             # Ensure final video duration matches total composite duration precisely
             final_video = final_video.set_duration(total_final_video_duration)
 
-            # Write final video
+            # Write final video, in parallel segments where processes can safely be forked (Linux only)
             print(f"🎬 Rendering final video: {output_path}")
-            final_video.write_videofile(
-                output_path,
-                fps=final_background_video_clip.fps, # Match background FPS for consistency
-                codec='libx264', # Reverted to libx264 for broader compatibility
-                audio_codec='aac',
-                temp_audiofile=os.path.join(self.temp_dir, 'temp-audio.m4a'),
-                remove_temp=True,
-                verbose=True, # Set to True to display progress bar
-                logger='bar', # Use 'bar' to display a simple ASCII progress bar
-                preset="fast" # Changed to "fast" for quicker rendering
-            )
+            encode_threads = max(1, max_workers or self.ENCODE_THREADS)
+            segment_count = min(self.RENDER_SEGMENTS, encode_threads) # Never more segment processes than workers
+            rendered_in_segments = (segment_count > 1 and sys.platform.startswith('linux') and
+                                    self._write_video_in_segments(final_video, background_full, output_path,
+                                                                  final_background_video_clip.fps, segment_count, encode_threads))
+            if not rendered_in_segments:
+                final_video.write_videofile(
+                    output_path,
+                    fps=final_background_video_clip.fps, # Match background FPS for consistency
+                    codec='libx264', # Reverted to libx264 for broader compatibility
+                    audio_codec='aac',
+                    temp_audiofile=os.path.join(self.temp_dir, 'temp-audio.m4a'),
+                    remove_temp=True,
+                    verbose=True, # Set to True to display progress bar
+                    logger='bar', # Use 'bar' to display a simple ASCII progress bar
+                    threads=encode_threads, # Encoding dominates wall time, so use every available core
+                    preset="veryfast", # Encode speed over file size
+                    ffmpeg_params=['-movflags', '+faststart'] # Put the index up front so the output streams
+                )
 
             print(f" Enhanced subtitle video created successfully: {output_path}")
             success = True
@@ -1084,8 +1708,6 @@ class RedditTTSSubtitles:
                 subtitle_clip.close()
             if 'intro_title_card_clip' in locals() and intro_title_card_clip is not None:
                 intro_title_card_clip.close()
-            if 'silent_buffer_audio_clip' in locals() and silent_buffer_audio_clip is not None:
-                silent_buffer_audio_clip.close()
             if 'final_audio_track' in locals() and final_audio_track is not None:
                 final_audio_track.close()
             if 'intro_composite' in locals() and intro_composite is not None:
@@ -1109,13 +1731,99 @@ class RedditTTSSubtitles:
         except Exception as e:
             print(f"Error cleaning up temporary directory {self.temp_dir}: {e}")
 
+def run_job(generator, post, rewards_img_path, max_workers=None):
+    """
+    Render one post with an existing generator, so models and caches are reused across posts.
+    A post is a dict with "story_text", "background_video" and "output", plus optional
+    "story_title", "post_author" and "voice_gender". max_workers is passed to create_subtitle_video.
+    Returns True if the video was written.
+    """
+    return generator.create_subtitle_video(
+        text=post['story_text'],
+        background_video_path=post['background_video'],
+        output_path=post['output'],
+        story_title_arg=post.get('story_title', 'A New Story'),
+        post_author_arg=post.get('post_author', '@RedditStories'),
+        rewards_img_path=rewards_img_path,
+        reddit_avatars_folder=generator.reddit_avatars_folder,
+        voice_gender_arg=post.get('voice_gender', 'J'),
+        max_workers=max_workers
+    )
+
+def _post_error(post, default_background_video):
+    """Fill in the default background video and return what is wrong with a post, or None if it can be rendered."""
+    if not isinstance(post, dict):
+        return "must be a JSON object"
+    post.setdefault('background_video', default_background_video)
+    if not post.get('story_text') or not post.get('output'):
+        return "needs 'story_text' and 'output'"
+    if not post['background_video'] or not os.path.exists(post['background_video']):
+        return f"background video not found: {post['background_video']}"
+    return None
+
+# Generator of the current batch worker process, created on its first post and reused for the rest
+_worker_generator = None
+
+def _render_one(post, generator_kwargs, rewards_img_path, encode_threads):
+    """Render a single batch post in a worker process. Returns True if the video was written."""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = RedditTTSSubtitles(**generator_kwargs)
+        _worker_generator.ENCODE_THREADS = encode_threads
+        _worker_generator.RENDER_SEGMENTS = 1 # Posts already render in parallel, so each one renders in a single process
+    return run_job(_worker_generator, post, rewards_img_path)
+
+def batch_generate(posts, workers=None, rewards_img_path='rewards.png', **generator_kwargs):
+    """
+    Render many posts in parallel worker processes, since every video is independent.
+    Each post is a dict with "story_text", "background_video" and "output", plus optional
+    "story_title", "post_author" and "voice_gender". generator_kwargs are passed to
+    RedditTTSSubtitles in each worker. Returns one success flag per post, in order.
+    """
+    results = [False] * len(posts)
+
+    # Anything that is not a JSON object cannot be rendered and stays marked as failed
+    jobs = []
+    for i, post in enumerate(posts):
+        if isinstance(post, dict):
+            jobs.append((i, post))
+        else:
+            print(f" Error: post {i + 1} is not a JSON object, skipping it.")
+    if not jobs:
+        return results
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    encode_threads = max(1, (os.cpu_count() or 1) // workers) # Split the cores between concurrent encodes
+
+    # A single worker gains nothing from a process pool: render in this process with one generator
+    if workers == 1:
+        generator = RedditTTSSubtitles(**generator_kwargs)
+        for i, post in jobs:
+            try:
+                results[i] = run_job(generator, post, rewards_img_path)
+            except Exception as e:
+                print(f" Error rendering post {i + 1} ({post.get('output')}): {e}")
+        return results
+
+    print(f"🎬 Rendering {len(jobs)} posts with {workers} worker process(es)...")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_render_one, post, generator_kwargs, rewards_img_path, encode_threads): i for i, post in jobs}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                print(f" Error rendering post {i + 1} ({posts[i].get('output')}): {e}")
+
+    return results
+
 def main():
     parser = argparse.ArgumentParser(description='Generate YouTube Shorts-style subtitled videos with maximum accuracy')
     
-    parser.add_argument('background_video', type=str,
-                        help='Path to the background video file.')
-    parser.add_argument('output', type=str,
-                        help='Desired path for the output video file.')
+    parser.add_argument('background_video', type=str, nargs='?',
+                        help='Path to the background video file. In batch mode, the default for posts without "background_video".')
+    parser.add_argument('output', type=str, nargs='?',
+                        help='Desired path for the output video file. Not used in batch mode.')
     
     parser.add_argument('--story-json', type=str, 
                         default='story.json', # Default to 'story.json' in current directory
@@ -1142,9 +1850,93 @@ def main():
     parser.add_argument('--voice-gender', type=str, default='J', choices=['J', 'M'],
                         help="Choose voice gender for Amazon Polly: 'J' for Joanna (female), 'M' for Matthew (male). Defaults to 'J'.")
 
+    parser.add_argument('--batch', type=str,
+                        help='Path to a JSON file with a list of posts to render in parallel. Each post has "story_text", "output" and optionally "story_title", "post_author", "background_video" and "voice_gender".')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                        help='Number of worker processes for --batch. Defaults to the number of CPUs.')
+    parser.add_argument('--serve', action='store_true',
+                        help='Read posts from stdin, one JSON object per line (same fields as --batch), and render them one after another with a single generator, so models load once.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='Number of CPU cores used to render a video (parallel segments and encoder threads). Defaults to the number of CPUs. Not used with --batch, which splits the cores between --jobs.')
+
 
     args = parser.parse_args()
 
+    generator_kwargs = {
+        'font_main_path': args.font_main_path,
+        'font_fallback_path': args.font_fallback_path,
+        'reddit_avatars_folder': args.reddit_avatars_folder,
+        'obfuscation_file_path': args.obfuscation_json
+    }
+
+    # Batch mode: every post is rendered in its own worker process
+    if args.batch:
+        try:
+            with open(args.batch, 'r', encoding='utf-8') as f:
+                posts = json.load(f)
+        except FileNotFoundError:
+            print(f"Error: Batch file not found at: {args.batch}")
+            return 1
+        except json.JSONDecodeError:
+            print(f"Error: Invalid JSON format in batch file: {args.batch}")
+            return 1
+
+        if not isinstance(posts, list) or not posts:
+            print("Error: The batch file must contain a non-empty list of posts.")
+            return 1
+
+        for i, post in enumerate(posts, start=1):
+            post_error = _post_error(post, args.background_video)
+            if post_error:
+                print(f"Error: Post {i} in the batch file: {post_error}")
+                return 1
+
+        try:
+            results = batch_generate(posts, workers=args.jobs, rewards_img_path=args.rewards_img, **generator_kwargs)
+        except KeyboardInterrupt:
+            print("\n  Operation cancelled by user")
+            return 1
+
+        print(f" Batch finished: {sum(results)}/{len(results)} videos rendered successfully.")
+        return 0 if all(results) else 1
+
+    # Serve mode: one generator renders every post read from stdin, in order
+    if args.serve:
+        generator = RedditTTSSubtitles(**generator_kwargs)
+        failures = 0
+        print(" Serving: reading one JSON post per line from stdin...")
+        try:
+            for line_number, line in enumerate(sys.stdin, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    post = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"Error: Invalid JSON on input line {line_number}.")
+                    failures += 1
+                    continue
+
+                post_error = _post_error(post, args.background_video)
+                if post_error:
+                    print(f"Error: Post on input line {line_number}: {post_error}")
+                    failures += 1
+                    continue
+
+                try:
+                    if not run_job(generator, post, args.rewards_img, max_workers=args.workers):
+                        failures += 1
+                except Exception as e:
+                    print(f" Error rendering {post['output']}: {e}")
+                    failures += 1
+        except KeyboardInterrupt:
+            print("\n  Operation cancelled by user")
+            return 1
+
+        return 0 if failures == 0 else 1
+
+    if not args.background_video or not args.output:
+        parser.error("background_video and output are required unless --batch or --serve is used")
+
     story_text = ""
     story_title = None
     post_author = None
@@ -1180,7 +1972,9 @@ def main():
 
     # Show available analysis methods
     print("🔍 Available timing analysis methods:")
-    if WHISPER_AVAILABLE:
+    if FASTER_WHISPER_AVAILABLE:
+        print("   faster-whisper (Highest Accuracy, Fastest)")
+    elif WHISPER_AVAILABLE:
         print("   Whisper AI (Highest Accuracy)")
     else:
         print("   Whisper AI (Install: pip install openai-whisper torch)")
@@ -1189,12 +1983,7 @@ def main():
     print()
 
     # Create subtitle generator, passing file paths for fonts and avatars
-    generator = RedditTTSSubtitles(
-        font_main_path=args.font_main_path,
-        font_fallback_path=args.font_fallback_path,
-        reddit_avatars_folder=args.reddit_avatars_folder,
-        obfuscation_file_path=args.obfuscation_json
-    )
+    generator = RedditTTSSubtitles(**generator_kwargs)
 
     try:
         # Pass all necessary args to create_subtitle_video
@@ -1206,7 +1995,8 @@ def main():
             post_author_arg=post_author,
             rewards_img_path=args.rewards_img, # Pass rewards image path
             reddit_avatars_folder=args.reddit_avatars_folder, # Pass avatars folder path
-            voice_gender_arg=args.voice_gender
+            voice_gender_arg=args.voice_gender,
+            max_workers=args.workers
         )
         return 0 if success else 1
 
@@ -1214,7 +2004,7 @@ def main():
         print("\n  Operation cancelled by user")
         return 1
     except Exception as e:
-        print(f Error: {e}")
+        print(f" Error: {e}")
         import traceback
         traceback.print_exc()
         return 1